@@ -2,7 +2,7 @@
 # /// script
 # dependencies = [
 #     "requests",
-#     "beautifulsoup4",
+#     "lxml",
 # ]
 # ///
 """
@@ -15,200 +15,436 @@ Example: uv run fccid_pdf_downloader.py BCG-E8726A
 
 import os
 import sys
+import json
+import queue
+import socket
+from io import BytesIO
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+from urllib3.util.request import ACCEPT_ENCODING
+from urllib3.util.retry import Retry
+from lxml import etree
 from urllib.parse import urljoin, urlparse
 import time
 import re
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 
+# Patterns used in the per-row and per-link loops
+_DATE_RE = re.compile(r'(\d{4}-\d{2}-\d{2})')
+_BAD_FN_RE = re.compile(r'[<>:"/\\|?*]')
+_ONCLICK_PDF_RE = re.compile(r'["\']([^"\']*\.pdf[^"\']*)["\']', re.IGNORECASE)
+_FCCID_RE = re.compile(r'^[A-Z0-9\-]+$')
+
+# Number of exhibit pages resolved to PDF URLs concurrently
+RESOLVE_WORKERS = 4
+# Number of PDFs downloaded concurrently
+MAX_WORKERS = 8
+# Average outbound request rate to stay polite to fccid.io
+REQUESTS_PER_SECOND = 4
+# Requests that may go out back-to-back before the average rate applies
+REQUESTS_BURST = 4
+# Idle seconds before TCP keepalive probes start, and seconds between probes
+TCP_KEEPALIVE_IDLE = 30
+TCP_KEEPALIVE_INTERVAL = 10
+# Read size used when streaming PDFs to disk
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+# PDFs are already compressed, so ask for them as-is; this also keeps
+# Content-Length equal to the size written to disk
+PDF_REQUEST_HEADERS = {'Accept-Encoding': 'identity'}
+# Largest non-PDF response to download when a PDF was expected
+MAX_NON_PDF_SIZE = 1024 * 1024
+# Chunks that may be buffered between the network reader and the disk writer
+WRITE_QUEUE_SIZE = 4
+# Records completed downloads so re-runs can skip them
+MANIFEST_NAME = '.manifest.json'
+
+
+def _text(elem):
+    """Return the stripped text content of an element and its children"""
+    return ''.join(elem.itertext()).strip()
+
+
+def _safe_pdf_name(name):
+    """Replace characters that are invalid in filenames and ensure a .pdf suffix"""
+    name = _BAD_FN_RE.sub('_', name)
+    return name if name[-4:].lower() == '.pdf' else name + '.pdf'
+
+
+def _cap_chunks(chunks, limit):
+    """Pass chunks through, failing once more than `limit` bytes have arrived"""
+    received = 0
+    for chunk in chunks:
+        received += len(chunk)
+        if received > limit:
+            raise requests.RequestException(f"response is not a PDF and is larger than {limit} bytes")
+        yield chunk
+
+
+def _write_chunks(chunks, filepath):
+    """Write byte chunks to a file from a background thread and return the byte count
+
+    The next network read proceeds while the previous chunk is being written,
+    so slow disks don't stall the download.
+    """
+    fd = os.open(filepath, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0), 0o666)
+    pending = queue.Queue(maxsize=WRITE_QUEUE_SIZE)
+    errors = []
+
+    def writer():
+        while True:
+            chunk = pending.get()
+            if chunk is None:
+                return
+            if errors:
+                continue  # Keep draining so the reader never blocks
+            try:
+                view = memoryview(chunk)
+                while view:
+                    view = view[os.write(fd, view):]
+            except OSError as e:
+                errors.append(e)
+
+    thread = threading.Thread(target=writer, daemon=True)
+    thread.start()
+
+    total = 0
+    try:
+        for chunk in chunks:
+            if errors:
+                break
+            pending.put(chunk)
+            total += len(chunk)
+    finally:
+        pending.put(None)
+        thread.join()
+        os.close(fd)
+
+    if errors:
+        raise errors[0]
+    return total
+
+
+def _exhibit_filename(exhibit_info):
+    """Pick a safe file name: the linked file name if it is a PDF, otherwise the exhibit name"""
+    filename = exhibit_info['filename']
+    if not filename or filename[-4:].lower() != '.pdf':
+        filename = exhibit_info['text']
+    return _safe_pdf_name(filename)
+
+
+def _assign_unique_filenames(exhibit_links):
+    """Give every exhibit its own file name so concurrent downloads never share a file
+
+    Repeated names (e.g. several "Test Report" exhibits) get a " (2)", " (3)", ...
+    suffix in page order, so the same exhibit keeps its name across runs.
+    """
+    taken = set()
+    for exhibit_info in exhibit_links:
+        filename = _exhibit_filename(exhibit_info)
+        stem = filename[:-4]
+        n = 1
+        # Compare case-insensitively for case-insensitive filesystems
+        while filename.lower() in taken:
+            n += 1
+            filename = f"{stem} ({n}).pdf"
+        taken.add(filename.lower())
+        exhibit_info['filename'] = filename
+
+
+class RateLimiter:
+    """Token bucket: allows bursts of up to `burst` calls to acquire() while averaging at most `rate` per second"""
+
+    __slots__ = ('_interval', '_slack', '_lock', '_next')
+
+    def __init__(self, rate, burst=1):
+        self._interval = 1.0 / rate
+        self._slack = (burst - 1) * self._interval
+        self._lock = threading.Lock()
+        self._next = time.monotonic()
+
+    def acquire(self):
+        with self._lock:
+            now = time.monotonic()
+            self._next = max(now, self._next)
+            wait = max(0, self._next - now - self._slack)
+            self._next += self._interval
+        time.sleep(wait)
+
+
+class KeepAliveAdapter(HTTPAdapter):
+    """HTTPAdapter that sends TCP keepalive probes on pooled sockets
+
+    Probes start after TCP_KEEPALIVE_IDLE seconds of silence (where the platform
+    lets us set it), so a connection dropped by a NAT or firewall is noticed
+    instead of hanging a request. They don't stop the server from closing idle
+    connections under its own HTTP keep-alive timeout.
+    """
+
+    def init_poolmanager(self, *args, **kwargs):
+        options = HTTPConnection.default_socket_options + [
+            (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+        ]
+        if hasattr(socket, 'TCP_KEEPIDLE'):
+            options.append((socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, TCP_KEEPALIVE_IDLE))
+        if hasattr(socket, 'TCP_KEEPINTVL'):
+            options.append((socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, TCP_KEEPALIVE_INTERVAL))
+        kwargs['socket_options'] = options
+        super().init_poolmanager(*args, **kwargs)
+
 
 class FCCIDDownloader:
+    __slots__ = ('fcc_id', 'base_url', 'limiter', 'manifest', 'manifest_path', '_manifest_lock', 'session')
+
     def __init__(self, fcc_id):
         self.fcc_id = fcc_id
         self.base_url = "https://fccid.io"
+        self.limiter = RateLimiter(REQUESTS_PER_SECOND, REQUESTS_BURST)
+        self.manifest = {}
+        self.manifest_path = None
+        self._manifest_lock = threading.Lock()
         self.session = requests.Session()
         self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+            'Accept-Encoding': ACCEPT_ENCODING,
         })
 
+        # All requests go to one host, so keep exactly one pooled connection
+        # per worker and have workers wait for a warm socket rather than
+        # opening throwaway ones that pay a fresh TLS handshake.
+        # Blocking without a pool timeout is safe because there is a slot for
+        # every worker and each worker holds at most one connection at a time:
+        # non-streamed responses are read in full and streamed PDF responses are
+        # only opened in a `with` block, so every connection goes back to the pool
+        adapter = KeepAliveAdapter(
+            pool_connections=1,
+            pool_maxsize=RESOLVE_WORKERS + MAX_WORKERS,
+            pool_block=True,
+            max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=(500, 502, 503, 504)),
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
     def get_fcc_page(self):
         """Fetch the main FCC ID page"""
         url = f"{self.base_url}/{self.fcc_id}"
         try:
+            self.limiter.acquire()
             response = self.session.get(url, timeout=30)
             response.raise_for_status()
-            return response.text
+            return response.content
         except requests.RequestException as e:
             print(f"Error fetching FCC ID page: {e}")
             return None
 
     def find_exhibit_links(self, html_content):
         """Extract all exhibit links from the page with their submission dates"""
-        soup = BeautifulSoup(html_content, 'html.parser')
         exhibit_links = []
-
-        # Look for the exhibits table
-        tables = soup.find_all('table')
-        for table in tables:
-            rows = table.find_all('tr')
-            if not rows:
+        pdf_links = []
+
+        # Only tables and links matter, so stream those elements and free
+        # each top-level table once it has been handled
+        events = etree.iterparse(BytesIO(html_content), events=('end',), tag=('a', 'table'), html=True)
+        for _, elem in events:
+            if elem.tag == 'a':
+                # Remember direct PDF links in case there is no exhibits table
+                href = elem.get('href')
+                if href and href[-4:].lower() == '.pdf':
+                    pdf_links.append((href, _text(elem)))
                 continue
 
-            # Check if this is the exhibits table by looking for headers
-            header_row = rows[0]
-            headers = [th.get_text(strip=True).lower() for th in header_row.find_all(['th', 'td'])]
-
-            # Look for table with submitted/available column
-            if any('submit' in header for header in headers):
-                for row in rows[1:]:  # Skip header row
-                    cells = row.find_all(['td', 'th'])
-                    if len(cells) < 2:
-                        continue
-
-                    # Look for any links in this row (not just PDFs)
-                    exhibit_link = None
-                    for cell in cells:
-                        link = cell.find('a', href=True)
-                        if link and link['href']:
-                            exhibit_link = link
-                            break
-
-                    if exhibit_link:
-                        # Find the date cell (look for "Submitted available" column)
-                        date_text = None
-                        for i, header in enumerate(headers):
-                            if 'submit' in header and i < len(cells):
-                                date_cell = cells[i]
-                                date_text = date_cell.get_text(strip=True)
-                                # Extract first date from the cell
-                                date_match = re.search(r'(\d{4}-\d{2}-\d{2})', date_text)
-                                if date_match:
-                                    date_text = date_match.group(1)
-                                break
-
-                        full_url = urljoin(self.base_url, exhibit_link['href'])
-
-                        # Get filename from URL or link text
-                        filename = os.path.basename(urlparse(exhibit_link['href']).path)
-                        if not filename:
-                            filename = exhibit_link.get_text(strip=True)
-                            filename = re.sub(r'[<>:"/\\|?*]', '_', filename)
-
-                        exhibit_links.append({
-                            'url': full_url,
-                            'filename': filename,
-                            'text': exhibit_link.get_text(strip=True),
-                            'date': date_text
-                        })
+            if elem.xpath('ancestor::table'):
+                continue  # Leave nested tables for their enclosing table
+
+            exhibit_links.extend(self._parse_exhibit_table(elem))
+            elem.clear()
 
         # Fallback: Look for direct PDF links without dates
         if not exhibit_links:
-            for link in soup.find_all('a', href=True):
-                href = link['href']
-                if href.lower().endswith('.pdf'):
-                    full_url = urljoin(self.base_url, href)
-                    exhibit_links.append({
-                        'url': full_url,
-                        'filename': os.path.basename(urlparse(href).path),
-                        'text': link.get_text(strip=True),
-                        'date': None
-                    })
+            base_url = self.base_url
+            for href, text in pdf_links:
+                full_url = urljoin(base_url, href)
+                exhibit_links.append({
+                    'url': full_url,
+                    'filename': os.path.basename(urlparse(href).path),
+                    'text': text,
+                    'date': None
+                })
+
+        return exhibit_links
+
+    def _parse_exhibit_table(self, table):
+        """Extract exhibit links from a table if it is the exhibits table"""
+        exhibit_links = []
+        base_url = self.base_url
+
+        # The exhibits table has a submitted/available column in its header row
+        exhibit_tables = table.xpath(
+            "descendant-or-self::table[(.//tr)[1]/*[self::th or self::td]"
+            "[contains(translate(normalize-space(.), 'SUBMIT', 'submit'), 'submit')]]"
+        )
+        for exhibit_table in exhibit_tables:
+            header_row = exhibit_table.xpath('(.//tr)[1]')[0]
+            headers = [_text(th).lower() for th in header_row.xpath('./th|./td')]
+            # Index of the "Submitted available" column holding the date
+            submit_idx = next((i for i, header in enumerate(headers) if 'submit' in header), None)
+
+            # Data rows with at least two cells and a link (not just PDFs),
+            # selected in a single query instead of walking rows and cells
+            data_rows = exhibit_table.xpath(
+                "(.//tr)[position() > 1][count(td|th) >= 2][(td|th)//a[@href!='']]"
+            )
+            for row in data_rows:
+                exhibit_link = row.xpath("(td|th)//a[@href!='']")[0]
+                href = exhibit_link.get('href')
+                link_text = _text(exhibit_link)
+
+                date_text = None
+                if submit_idx is not None:
+                    cells = row.xpath('td|th')
+                    if submit_idx < len(cells):
+                        date_text = _text(cells[submit_idx])
+                        # Extract first date from the cell
+                        date_match = _DATE_RE.search(date_text)
+                        if date_match:
+                            date_text = date_match.group(1)
+
+                full_url = urljoin(base_url, href)
+
+                # Get filename from URL or link text
+                filename = os.path.basename(urlparse(href).path)
+                if not filename:
+                    filename = link_text
+
+                exhibit_links.append({
+                    'url': full_url,
+                    'filename': filename,
+                    'text': link_text,
+                    'date': date_text
+                })
 
         return exhibit_links
 
     def get_pdf_download_url(self, exhibit_url):
         """Follow an exhibit link to find the actual PDF download URL"""
+        # Many exhibit URLs redirect straight to the PDF, in which case
+        # there is no page to fetch and parse
+        try:
+            self.limiter.acquire()
+            head = self.session.head(exhibit_url, allow_redirects=True, timeout=15,
+                                     headers={'Accept': 'application/pdf, text/html;q=0.9, */*;q=0.8'})
+            if head.ok:
+                content_type = head.headers.get('content-type', '').lower()
+                if content_type.startswith('application/pdf') or head.url[-4:].lower() == '.pdf':
+                    return head.url
+        except requests.RequestException:
+            pass  # The probe is only a shortcut; fall back to fetching the page
+
         try:
+            self.limiter.acquire()
             response = self.session.get(exhibit_url, timeout=30)
             response.raise_for_status()
-            soup = BeautifulSoup(response.text, 'html.parser')
-
-            # Look for download buttons or links
-            download_links = []
-
-            # Common patterns for download buttons/links
-            for link in soup.find_all('a', href=True):
-                href = link['href']
-                link_text = link.get_text(strip=True).lower()
-
-                # Look for download-related text or direct PDF links
-                if (href.lower().endswith('.pdf') or
-                    'download' in link_text or
-                    'pdf' in link_text):
-                    full_url = urljoin(self.base_url, href)
-                    download_links.append(full_url)
-
-            # Look for buttons with download functionality
-            for button in soup.find_all(['button', 'input'], type='button'):
-                onclick = button.get('onclick', '')
-                if 'download' in onclick.lower() or '.pdf' in onclick.lower():
-                    # Extract URL from onclick if present
-                    url_match = re.search(r'["\']([^"\']*\.pdf[^"\']*)["\']', onclick)
-                    if url_match:
-                        full_url = urljoin(self.base_url, url_match.group(1))
-                        download_links.append(full_url)
-
-            # Return the first valid PDF download link found
-            for url in download_links:
-                if url.lower().endswith('.pdf'):
-                    return url
 
-            return None
+            # Look for download links or buttons in one streaming pass over just
+            # those elements, stopping at the first direct PDF link
+            button_url = None
+            base_url = self.base_url
+
+            events = etree.iterparse(BytesIO(response.content), events=('end',),
+                                     tag=('a', 'button', 'input'), html=True)
+            for _, elem in events:
+                if elem.tag == 'a':
+                    # Only direct PDF links can be returned, so there is no
+                    # need to look at the link text of anything else
+                    href = elem.get('href')
+                    if href is not None and href[-4:].lower() == '.pdf':
+                        # Links take priority over buttons
+                        return urljoin(base_url, href)
+
+                # Otherwise fall back to the first button that downloads a PDF
+                elif button_url is None and elem.get('type') == 'button':
+                    onclick = elem.get('onclick', '')
+                    onclick_l = onclick.lower()
+                    if 'download' in onclick_l or '.pdf' in onclick_l:
+                        # Extract URL from onclick if present
+                        url_match = _ONCLICK_PDF_RE.search(onclick)
+                        if url_match:
+                            full_url = urljoin(base_url, url_match.group(1))
+                            if full_url[-4:].lower() == '.pdf':
+                                button_url = full_url
+
+                elem.clear()
+
+            return button_url
 
         except requests.RequestException as e:
             print(f"Error fetching exhibit page {exhibit_url}: {e}")
             return None
+        except etree.LxmlError as e:
+            print(f"Error parsing exhibit page {exhibit_url}: {e}")
+            return None
 
-    def download_exhibit(self, exhibit_info, download_dir):
-        """Download a single exhibit PDF file"""
-        exhibit_url = exhibit_info['url']
-        exhibit_name = exhibit_info['text']
-
-        # First, get the actual PDF download URL from the exhibit page
-        print(f"Finding PDF download for: {exhibit_name}")
-        pdf_url = self.get_pdf_download_url(exhibit_url)
-
-        if not pdf_url:
-            print(f"✗ Could not find PDF download link for: {exhibit_name}")
-            return False
-
-        # Create filename from exhibit name or use PDF URL
+    def download_exhibit(self, exhibit_info, pdf_url, download_dir):
+        """Download a single exhibit PDF file from its resolved PDF URL"""
+        # Already made safe and unique by _assign_unique_filenames
         filename = exhibit_info['filename']
-        if not filename or not filename.lower().endswith('.pdf'):
-            # Use exhibit name as filename
-            filename = exhibit_name
-            filename = re.sub(r'[<>:"/\\|?*]', '_', filename)
-            if not filename.lower().endswith('.pdf'):
-                filename += '.pdf'
-
-        # Sanitize filename
-        filename = re.sub(r'[<>:"/\\|?*]', '_', filename)
         filepath = os.path.join(download_dir, filename)
 
+        if self._is_already_downloaded(pdf_url, filename, filepath):
+            print(f"✓ Already downloaded: {filename}")
+            return True
+
+        part_path = filepath + '.part'
         try:
             print(f"Downloading PDF: {filename}")
-            response = self.session.get(pdf_url, timeout=60)
-            response.raise_for_status()
-
-            # Check if response is actually a PDF
-            content_type = response.headers.get('content-type', '').lower()
-            if 'pdf' not in content_type and not pdf_url.lower().endswith('.pdf'):
-                print(f"✗ Warning: {filename} may not be a PDF (content-type: {content_type})")
-
-            with open(filepath, 'wb') as f:
-                f.write(response.content)
+            self.limiter.acquire()
+            with self.session.get(pdf_url, timeout=60, stream=True, headers=PDF_REQUEST_HEADERS) as response:
+                response.raise_for_status()
+
+                chunks = response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE)
+
+                # Check if response is actually a PDF, and don't pull down a
+                # large error page the server sent in place of one
+                content_type = response.headers.get('content-type', '').lower()
+                if 'pdf' not in content_type:
+                    # Generic binary types may still be a PDF, so only cap
+                    # responses that declare some other specific type
+                    if content_type and not content_type.startswith('application/octet-stream'):
+                        length = response.headers.get('content-length', '')
+                        if length.isdigit() and int(length) > MAX_NON_PDF_SIZE:
+                            print(f"✗ Skipping {filename}: not a PDF (content-type: {content_type}, {length} bytes)")
+                            return False
+                        # Chunked responses have no length up front
+                        chunks = _cap_chunks(chunks, MAX_NON_PDF_SIZE)
+                    if pdf_url[-4:].lower() != '.pdf':
+                        print(f"✗ Warning: {filename} may not be a PDF (content-type: {content_type})")
+
+                # Write the body as it arrives instead of buffering it in memory,
+                # to a temporary name so a failed download never leaves a
+                # truncated PDF behind under the real name
+                total = _write_chunks(chunks, part_path)
+                os.replace(part_path, filepath)
+
+                etag = response.headers.get('etag')
 
             # Set file timestamp if date is available
             if exhibit_info.get('date'):
                 try:
-                    date_obj = datetime.strptime(exhibit_info['date'], '%Y-%m-%d')
-                    timestamp = date_obj.timestamp()
+                    # Dates are always YYYY-MM-DD, so skip strptime's format parsing
+                    year, month, day = exhibit_info['date'].split('-')
+                    timestamp = datetime(int(year), int(month), int(day)).timestamp()
                     os.utime(filepath, (timestamp, timestamp))
                 except ValueError:
                     pass  # If date parsing fails, just keep current timestamp
 
-            print(f"✓ Downloaded: {filename} ({len(response.content)} bytes)")
+            # Only remember real PDFs, so an error page saved in place of one
+            # is fetched again on the next run
+            if 'pdf' in content_type:
+                self._record_download(pdf_url, filename, total, etag)
+
+            print(f"✓ Downloaded: {filename} ({total} bytes)")
             return True
 
         except requests.RequestException as e:
@@ -217,6 +453,85 @@ class FCCIDDownloader:
         except IOError as e:
             print(f"✗ Failed to save {filename}: {e}")
             return False
+        finally:
+            # Also covers Ctrl-C; after a successful download it is already gone
+            if os.path.exists(part_path):
+                try:
+                    os.remove(part_path)
+                except OSError:
+                    pass
+
+    def _load_manifest(self, download_dir):
+        """Load the record of previously completed downloads, if any"""
+        self.manifest_path = os.path.join(download_dir, MANIFEST_NAME)
+        try:
+            with open(self.manifest_path) as f:
+                manifest = json.load(f)
+        except (IOError, ValueError):
+            manifest = {}
+
+        # Ignore a manifest that isn't the {filename: {...}} layout we write
+        if not isinstance(manifest, dict) or not all(isinstance(entry, dict) for entry in manifest.values()):
+            manifest = {}
+        self.manifest = manifest
+
+    def _record_download(self, pdf_url, filename, size, etag):
+        """Add a completed download to the manifest and atomically rewrite it"""
+        with self._manifest_lock:
+            # Keyed by file name: several exhibits can resolve to the same PDF URL
+            self.manifest[filename] = {'url': pdf_url, 'size': size, 'etag': etag}
+            if not self.manifest_path:
+                return
+
+            tmp_path = self.manifest_path + '.tmp'
+            try:
+                with open(tmp_path, 'w') as f:
+                    json.dump(self.manifest, f, indent=2)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_path, self.manifest_path)
+            except IOError as e:
+                print(f"✗ Failed to save download manifest: {e}")
+
+    def _is_already_downloaded(self, pdf_url, filename, filepath):
+        """Check whether a previous run already saved this PDF in full to this file"""
+        # Only trust a file that the manifest says holds this URL's PDF
+        entry = self.manifest.get(filename)
+        if not entry or entry.get('url') != pdf_url or not os.path.exists(filepath):
+            return False
+
+        size = os.path.getsize(filepath)
+        if entry.get('size') != size:
+            return False  # Interrupted or overwritten since it was recorded
+
+        try:
+            self.limiter.acquire()
+            head = self.session.head(pdf_url, allow_redirects=True, timeout=15, headers=PDF_REQUEST_HEADERS)
+            head.raise_for_status()
+        except requests.RequestException:
+            return False
+
+        # Unchanged on the server since we recorded it
+        etag = head.headers.get('etag')
+        if etag and entry.get('etag') == etag:
+            return True
+
+        # Otherwise trust a file that matches the advertised size
+        length = head.headers.get('content-length', '')
+        return length.isdigit() and size == int(length)
+
+    def _resolve_worker(self, i, total, exhibit_info):
+        """Find the PDF URL for one exhibit from a worker thread"""
+        exhibit_name = exhibit_info['text']
+        date_info = f" (submitted: {exhibit_info['date']})" if exhibit_info.get('date') else ""
+        print(f"\n[{i}/{total}] {exhibit_name}{date_info}")
+
+        print(f"Finding PDF download for: {exhibit_name}")
+        pdf_url = self.get_pdf_download_url(exhibit_info['url'])
+
+        if not pdf_url:
+            print(f"✗ Could not find PDF download link for: {exhibit_name}")
+        return pdf_url
 
     def download_all_exhibits(self):
         """Main method to download all exhibits for the FCC ID"""
@@ -228,6 +543,10 @@ class FCCIDDownloader:
 
         exhibit_links = self.find_exhibit_links(html_content)
 
+        # The same exhibit can be linked from more than one row
+        seen = set()
+        exhibit_links = [link for link in exhibit_links if not (link['url'] in seen or seen.add(link['url']))]
+
         if not exhibit_links:
             print("No exhibit documents found for this FCC ID")
             return False
@@ -237,21 +556,42 @@ class FCCIDDownloader:
         # Create download directory
         download_dir = self.fcc_id
         os.makedirs(download_dir, exist_ok=True)
+        self._load_manifest(download_dir)
 
-        successful_downloads = 0
-
-        for i, exhibit_info in enumerate(exhibit_links, 1):
-            date_info = f" (submitted: {exhibit_info['date']})" if exhibit_info.get('date') else ""
-            print(f"\n[{i}/{len(exhibit_links)}] {exhibit_info['text']}{date_info}")
-
-            if self.download_exhibit(exhibit_info, download_dir):
-                successful_downloads += 1
+        # Settle file names up front, before any downloads run in parallel
+        _assign_unique_filenames(exhibit_links)
 
-            # Be respectful and add a small delay
-            time.sleep(1)
+        successful_downloads = 0
+        total = len(exhibit_links)
+
+        # Resolve exhibit pages and download PDFs in separate pools so each
+        # download starts as soon as its PDF URL is known, while the
+        # remaining exhibit pages are still being fetched
+        with ThreadPoolExecutor(max_workers=RESOLVE_WORKERS) as resolvers, \
+                ThreadPoolExecutor(max_workers=MAX_WORKERS) as downloaders:
+            resolving = {
+                resolvers.submit(self._resolve_worker, i, total, exhibit_info): exhibit_info
+                for i, exhibit_info in enumerate(exhibit_links, 1)
+            }
+            downloads = []
+            try:
+                for future in as_completed(resolving):
+                    pdf_url = future.result()
+                    if pdf_url:
+                        downloads.append(downloaders.submit(
+                            self.download_exhibit, resolving[future], pdf_url, download_dir))
+
+                for future in as_completed(downloads):
+                    if future.result():
+                        successful_downloads += 1
+            except BaseException:
+                # Drop queued work so Ctrl-C doesn't wait for every remaining exhibit
+                for future in list(resolving) + downloads:
+                    future.cancel()
+                raise
 
         print(f"\nDownload complete!")
-        print(f"Successfully downloaded {successful_downloads}/{len(exhibit_links)} exhibit(s)")
+        print(f"Successfully downloaded {successful_downloads}/{total} exhibit(s)")
         print(f"Files saved to: {os.path.abspath(download_dir)}")
 
         return successful_downloads > 0
@@ -266,7 +606,7 @@ def main():
     fcc_id = sys.argv[1]
 
     # Validate FCC ID format (basic check)
-    if not re.match(r'^[A-Z0-9\-]+$', fcc_id):
+    if not _FCCID_RE.match(fcc_id):
         print(f"Warning: '{fcc_id}' doesn't look like a standard FCC ID format")
 
     downloader = FCCIDDownloader(fcc_id)